@@ -1,15 +1,15 @@
 """
 Retrieve JSON schemas for validating dicts representing a ``pyproject.toml`` file.
 """
-import json
 import logging
 import sys
+from collections import OrderedDict
 from enum import Enum
-from functools import partial, reduce
-from itertools import chain
+from functools import partial
 from types import MappingProxyType, ModuleType
 from typing import (
     TYPE_CHECKING,
+    Any,
     Callable,
     Dict,
     Iterator,
@@ -29,7 +29,6 @@ from .extra_validations import EXTRA_VALIDATIONS
 from .types import FormatValidationFn, Schema, ValidationFn
 
 _logger = logging.getLogger(__name__)
-_chain_iter = chain.from_iterable
 
 if TYPE_CHECKING:  # pragma: no cover
     from .plugins import PluginWrapper  # noqa
@@ -44,8 +43,16 @@ try:  # pragma: no cover
     def read_text(package: Union[str, ModuleType], resource) -> str:
         return files(package).joinpath(resource).read_text(encoding="utf-8")
 
+    def read_binary(package: Union[str, ModuleType], resource) -> bytes:
+        return files(package).joinpath(resource).read_bytes()
+
 except ImportError:  # pragma: no cover
-    from importlib.resources import read_text
+    from importlib.resources import read_binary, read_text  # noqa: F401
+
+try:  # pragma: no cover
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as _json_loads  # type: ignore[assignment]
 
 
 T = TypeVar("T", bound=Mapping)
@@ -55,6 +62,13 @@ ALL_PLUGINS = AllPlugins.ALL_PLUGINS
 TOP_LEVEL_SCHEMA = "pyproject_toml"
 PROJECT_TABLE_SCHEMA = "project_metadata"
 
+# Compiling the schema is much more expensive than validating, so the result is
+# shared between ``Validator`` objects using the same plugins (see
+# :attr:`PluginWrapper.identity`) and the same format validators.
+# Only the ``_COMPILED_CACHE_SIZE`` most recently used entries are kept.
+_COMPILED_CACHE_SIZE = 32
+_COMPILED_CACHE: "OrderedDict[Tuple, Callable[..., Any]]" = OrderedDict()
+
 
 def _get_public_functions(module: ModuleType) -> Mapping[str, FormatValidationFn]:
     return {
@@ -69,9 +83,10 @@ FORMAT_FUNCTIONS = MappingProxyType(_get_public_functions(formats))
 
 def load(name: str, package: str = __package__, ext: str = ".schema.json") -> Schema:
     """Load the schema from a JSON Schema file.
-    The returned dict-like object is immutable.
+    The returned object is the freshly parsed ``dict`` (not shared with other callers),
+    so it can be modified without copying.
     """
-    return Schema(json.loads(read_text(package, f"{name}{ext}")))
+    return Schema(_json_loads(read_binary(package, f"{name}{ext}")))
 
 
 def load_builtin_plugin(name: str) -> Schema:
@@ -89,11 +104,13 @@ class SchemaRegistry(Mapping[str, Schema]):
     itself, all schemas provided by plugins **MUST** have a top level ``$id``.
     """
 
+    __slots__ = ("_schemas", "_spec_version", "_main_id", "__weakref__")
+
     def __init__(self, plugins: Sequence["PluginWrapper"] = ()):
         self._schemas: Dict[str, Tuple[str, str, Schema]] = {}
         # (which part of the TOML, who defines, schema)
 
-        top_level = cast(dict, load(TOP_LEVEL_SCHEMA))  # Make it mutable
+        top_level = cast(dict, load(TOP_LEVEL_SCHEMA))  # Fresh dict, safe to modify
         self._spec_version = top_level["$schema"]
         top_properties = top_level["properties"]
         tool_properties = top_properties["tool"].setdefault("properties", {})
@@ -116,7 +133,7 @@ class SchemaRegistry(Mapping[str, Schema]):
                 _logger.info(f"{pid} defines `tool.{tool}` schema")
             sid = self._ensure_compatibility(tool, schema)["$id"]
             tool_properties[tool] = {"$ref": sid}
-            self._schemas[sid] = (f"tool.{tool}", pid, schema)
+            self._schemas.setdefault(sid, (f"tool.{tool}", pid, schema))
 
         self._main_id = sid = top_level["$id"]
         main_schema = Schema(top_level)
@@ -137,7 +154,8 @@ class SchemaRegistry(Mapping[str, Schema]):
         if "$id" not in schema:
             raise errors.SchemaMissingId(reference)
         sid = schema["$id"]
-        if sid in self._schemas:
+        # Identical schemas (e.g. shared by different plugins) can be reused
+        if sid in self._schemas and self._schemas[sid][-1] != schema:
             raise errors.SchemaWithDuplicatedId(sid)
         version = schema.get("$schema")
         if version and version != self.spec_version:
@@ -162,15 +180,18 @@ class RefHandler(Mapping[str, Callable[[str], Schema]]):
     This class will ensure all the URIs are loaded from the local registry.
     """
 
+    __slots__ = ("_uri_schemas", "_registry", "_resolver", "__weakref__")
+
     def __init__(self, registry: Mapping[str, Schema]):
-        self._uri_schemas = ["http", "https"]
+        self._uri_schemas = {"http", "https"}
         self._registry = registry
+        self._resolver = registry.__getitem__
 
     def __contains__(self, key) -> bool:
-        return_val = isinstance(key, str)
-        if return_val and key not in self._uri_schemas:
-            self._uri_schemas.append(key)
-        return return_val
+        if not isinstance(key, str):
+            return False
+        self._uri_schemas.add(key)
+        return True
 
     def __iter__(self) -> Iterator[str]:
         return iter(self._uri_schemas)
@@ -180,10 +201,51 @@ class RefHandler(Mapping[str, Callable[[str], Schema]]):
 
     def __getitem__(self, key: str) -> Callable[[str], Schema]:
         """All the references should be retrieved from the registry"""
-        return self._registry.__getitem__
+        return self._resolver
+
+
+def _compiled_cache_key(
+    plugins: Sequence["PluginWrapper"], fmts: Mapping[str, FormatValidationFn]
+) -> Optional[Tuple]:
+    # Regex (string) formats are embedded in the generated code, while the format
+    # functions are only referenced by ``id`` (the compiled function keeps them alive)
+    fmts_key = tuple((k, v if isinstance(v, str) else id(v)) for k, v in fmts.items())
+    key = (tuple(p.identity for p in plugins), tuple(sorted(fmts_key)))
+    try:
+        hash(key)
+    except TypeError:  # unhashable plugin identity, caching is not possible
+        return None
+    return key
+
+
+def _get_compiled(key: Tuple) -> Optional[Callable[..., Any]]:
+    compiled = _COMPILED_CACHE.get(key)
+    if compiled is not None:
+        _COMPILED_CACHE.move_to_end(key)
+    return compiled
+
+
+def _store_compiled(key: Tuple, compiled: Callable[..., Any]):
+    _COMPILED_CACHE[key] = compiled
+    while len(_COMPILED_CACHE) > _COMPILED_CACHE_SIZE:
+        _COMPILED_CACHE.popitem(last=False)
 
 
 class Validator:
+    __slots__ = (
+        "_code_cache",
+        "_cache",
+        "_schema",
+        "_schema_registry",
+        "_handlers",
+        "_formats_dict",
+        "_format_validators",
+        "_extra_validations",
+        "_plugins",
+        "_cache_key",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         plugins: Union[Sequence["PluginWrapper"], AllPlugins] = ALL_PLUGINS,
@@ -193,9 +255,14 @@ class Validator:
         self._code_cache: Optional[str] = None
         self._cache: Optional[ValidationFn] = None
         self._schema: Optional[Schema] = None
+        self._schema_registry: Optional[SchemaRegistry] = None
+        self._handlers: Optional[RefHandler] = None
 
         # Let's make the following options readonly
-        self._format_validators = MappingProxyType(format_validators)
+        # (a plain dict copy is handed to the generated code, avoiding the proxy
+        # indirection for each format lookup during validation)
+        self._formats_dict = dict(format_validators)
+        self._format_validators = MappingProxyType(self._formats_dict)
         self._extra_validations = tuple(extra_validations)
 
         if plugins is ALL_PLUGINS:
@@ -205,17 +272,35 @@ class Validator:
         else:
             self._plugins = tuple(plugins)  # force immutability / read only
 
-        self._schema_registry = SchemaRegistry(self._plugins)
-        self.handlers = RefHandler(self._schema_registry)
+        self._cache_key = _compiled_cache_key(self._plugins, self._formats_dict)
+        if self._cache_key is None or self._cache_key not in _COMPILED_CACHE:
+            # Load the schemas right away, so any problem with the plugins is
+            # reported when the validator is created. When a validation function was
+            # already compiled for the same plugins (see ``_COMPILED_CACHE``), they
+            # have been checked before and are only loaded if needed.
+            self._schema_registry = SchemaRegistry(self._plugins)
 
     @property
     def registry(self) -> SchemaRegistry:
+        if self._schema_registry is None:
+            self._schema_registry = SchemaRegistry(self._plugins)
         return self._schema_registry
 
+    @property
+    def handlers(self) -> "RefHandler":
+        if self._handlers is None:
+            self._handlers = RefHandler(self.registry)
+        return self._handlers
+
+    @handlers.setter
+    def handlers(self, value: "RefHandler"):
+        self._handlers = value
+        self._cache_key = None  # custom handlers: don't share compiled functions
+
     @property
     def schema(self) -> Schema:
         """Top level ``pyproject.toml`` JSON Schema"""
-        return Schema({"$ref": self._schema_registry.main})
+        return Schema({"$ref": self.registry.main})
 
     @property
     def extra_validations(self) -> Sequence[ValidationFn]:
@@ -230,21 +315,32 @@ class Validator:
     @property
     def generated_code(self) -> str:
         if self._code_cache is None:
-            fmts = dict(self.formats)
+            fmts = self._formats_dict
             self._code_cache = FJS.compile_to_code(self.schema, self.handlers, fmts)
 
         return self._code_cache
 
     def __getitem__(self, schema_id: str) -> Schema:
         """Retrieve a schema from registry"""
-        return self._schema_registry[schema_id]
+        return self.registry[schema_id]
 
     def __call__(self, pyproject: T) -> T:
-        if self._cache is None:
-            compiled = FJS.compile(self.schema, self.handlers, dict(self.formats))
-            fn = partial(compiled, custom_formats=self._format_validators)
-            self._cache = cast(ValidationFn, fn)
+        cache = self._cache
+        if cache is None:
+            fmts = self._formats_dict
+            key = self._cache_key
+            compiled = None if key is None else _get_compiled(key)
+            if compiled is None:
+                compiled = FJS.compile(self.schema, self.handlers, fmts)
+                if key is not None:
+                    _store_compiled(key, compiled)
+            fn = partial(compiled, custom_formats=fmts)
+            cache = self._cache = cast(ValidationFn, fn)
 
         with detailed_errors():
-            self._cache(pyproject)
-        return reduce(lambda acc, fn: fn(acc), self.extra_validations, pyproject)
+            cache(pyproject)
+
+        result = pyproject
+        for validation in self._extra_validations:
+            result = validation(result)
+        return result
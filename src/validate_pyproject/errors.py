@@ -36,7 +36,7 @@ class SchemaMissingId(JsonSchemaDefinitionException):
 class SchemaWithDuplicatedId(JsonSchemaDefinitionException):
     """\
     All schemas used in the validator MUST define a unique toplevel `"$id"`.
-    `$id = {schema_id!r}` was found at least twice.
+    `$id = {schema_id!r}` was found at least twice (with different contents).
     """
 
     def __init__(self, schema_id: str):
@@ -8,7 +8,7 @@
 import sys
 from string import Template
 from textwrap import dedent
-from typing import Any, Callable, Iterable, List, Optional, cast
+from typing import Any, Callable, Iterable, List, Optional, Tuple, cast
 
 from .. import __version__
 from ..types import Plugin
@@ -36,6 +36,14 @@ class PluginWrapper:
     def tool(self):
         return self._tool
 
+    @property
+    def identity(self) -> Tuple[str, Plugin]:
+        """Hashable value identifying the schema produced by the plugin
+        (e.g. for caching). Unlike :attr:`id`, it distinguishes between different
+        functions sharing the same module and name (such as closures or lambdas).
+        """
+        return (self._tool, self._load_fn)
+
     @property
     def schema(self):
         return self._load_fn(self.tool)
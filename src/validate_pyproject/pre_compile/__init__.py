@@ -1,11 +1,23 @@
 import logging
 import os
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 from types import MappingProxyType
-from typing import TYPE_CHECKING, Dict, Mapping, Optional, Sequence, Union
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Mapping,
+    Match,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+    Union,
+)
 
-from .. import api, dist_name, types
+from .. import api, dist_name, formats, types
 from .._vendor import fastjsonschema as FJS
 
 if sys.version_info[:2] >= (3, 8):  # pragma: no cover
@@ -46,9 +58,10 @@ def pre_compile(
     replacements = {**TEXT_REPLACEMENTS, **text_replacements}
 
     validator = api.Validator(plugins)
-    header = "\n".join(NOCHECK_HEADERS)
-    code = replace_text(validator.generated_code, replacements)
-    (out / "fastjsonschema_validations.py").write_text(header + code, "UTF-8")
+    code = _rewrite_generated_code(
+        validator.generated_code, validator.formats, replacements
+    )
+    (out / "fastjsonschema_validations.py").write_text(NOCHECK_HEADER + code, "UTF-8")
 
     copy_fastjsonschema_exceptions(out, replacements)
     copy_module("extra_validations", out, replacements)
@@ -61,24 +74,97 @@ def pre_compile(
     return out
 
 
-def replace_text(text: str, replacements: Dict[str, str]) -> str:
+def replace_text(text: str, replacements: Mapping[str, str]) -> str:
+    """Apply the entries of :obj:`TEXT_REPLACEMENTS` (in a single pass), then the
+    remaining ``replacements`` one after the other (so they can act on the output
+    of the previous ones).
+    """
+    return _replace_extra(_replace_defaults(text, replacements), replacements)
+
+
+def _replace_defaults(text: str, replacements: Mapping[str, str]) -> str:
+    keys = tuple(k for k in TEXT_REPLACEMENTS if k in replacements)
+    if not keys:
+        return text
+    return _replacements_regex(keys).sub(lambda m: replacements[m.group(0)], text)
+
+
+def _replace_extra(text: str, replacements: Mapping[str, str]) -> str:
     for orig, subst in replacements.items():
-        text = text.replace(orig, subst)
+        if orig not in TEXT_REPLACEMENTS:
+            text = text.replace(orig, subst)
     return text
 
 
+@lru_cache(maxsize=None)
+def _replacements_regex(keys: Tuple[str, ...], *extra: str) -> Pattern[str]:
+    """Single regex matching any of the given keys, so they can be replaced in one
+    pass (longer keys take precedence).
+    ``extra`` regex patterns can be given to be matched before the keys.
+    """
+    ordered = sorted((k for k in keys if k), key=len, reverse=True)
+    alternatives = (*extra, *(re.escape(k) for k in ordered))
+    return re.compile("|".join(alternatives) or "(?!)")
+
+
+CUSTOM_FORMAT_LOOKUP = r'custom_formats\["(?P<format>[^"]+)"\]'
+
+
+def _rewrite_generated_code(
+    code: str,
+    fmts: Mapping[str, types.FormatValidationFn],
+    replacements: Mapping[str, str],
+) -> str:
+    """Equivalent to :func:`replace_text`, but the generated code is also specialized
+    to ``fmts`` in the same pass used for the :obj:`TEXT_REPLACEMENTS` entries.
+
+    The functions used for the custom formats are already known when the code is
+    generated, so the ``custom_formats[...]`` lookups can be replaced with direct
+    references to the functions in the (copied) ``formats`` module.
+    Only functions defined in :mod:`validate_pyproject.formats` are specialized.
+    """
+    known = {
+        name: fn.__name__
+        for name, fn in fmts.items()
+        if getattr(fn, "__module__", None) == formats.__name__
+        and getattr(formats, getattr(fn, "__name__", ""), None) is fn
+    }
+    used: Dict[str, str] = {}
+
+    def _replace(match: Match[str]) -> str:
+        fmt = match.group("format")
+        if fmt is None:
+            return replacements[match.group(0)]
+        fn_name = known.get(fmt)
+        if fn_name is None:
+            return _replace_defaults(match.group(0), replacements)
+        used[fn_name] = alias = f"_fmt_{fn_name}"
+        return alias
+
+    keys = tuple(k for k in TEXT_REPLACEMENTS if k in replacements)
+    code = _replacements_regex(keys, CUSTOM_FORMAT_LOOKUP).sub(_replace, code)
+    code = _replace_extra(code, replacements)
+    if not used:
+        return code
+
+    imports = "".join(f"    {fn} as {alias},\n" for fn, alias in sorted(used.items()))
+    imports = replace_text(f"from .formats import (\n{imports})\n", replacements)
+    version, _, rest = code.partition("\n")
+    return f"{version}\n{imports}{rest}"
+
+
 def copy_fastjsonschema_exceptions(
     output_dir: Path, replacements: Dict[str, str]
 ) -> Path:
     file = output_dir / "fastjsonschema_exceptions.py"
-    code = replace_text(api.read_text(FJS.__name__, "exceptions.py"), replacements)
+    code = replace_text(_read_resource(FJS.__name__, "exceptions.py"), replacements)
     file.write_text(code, "UTF-8")
     return file
 
 
 def copy_module(name: str, output_dir: Path, replacements: Dict[str, str]) -> Path:
     file = output_dir / f"{name}.py"
-    code = api.read_text(api.__package__, f"{name}.py")
+    code = _read_resource(api.__package__, f"{name}.py")
     code = replace_text(code, replacements)
     file.write_text(code, "UTF-8")
     return file
@@ -87,7 +173,7 @@ def copy_module(name: str, output_dir: Path, replacements: Dict[str, str]) -> Pa
 def write_main(
     file_path: Path, schema: types.Schema, replacements: Dict[str, str]
 ) -> Path:
-    code = api.read_text(__name__, "main_file.template")
+    code = _read_resource(__name__, "main_file.template")
     code = replace_text(code, replacements)
     file_path.write_text(code, "UTF-8")
     return file_path
@@ -97,11 +183,11 @@ def write_notice(
     out: Path, main_file: str, cmd: str, replacements: Dict[str, str]
 ) -> Path:
     if cmd:
-        opening = api.read_text(__name__, "cli-notice.template")
+        opening = _read_resource(__name__, "cli-notice.template")
         opening = opening.format(command=cmd)
     else:
-        opening = api.read_text(__name__, "api-notice.template")
-    notice = api.read_text(__name__, "NOTICE.template")
+        opening = _read_resource(__name__, "api-notice.template")
+    notice = _read_resource(__name__, "NOTICE.template")
     notice = notice.format(notice=opening, main_file=main_file, **load_licenses())
     notice = replace_text(notice, replacements)
 
@@ -112,11 +198,24 @@ def write_notice(
 
 def load_licenses() -> Dict[str, str]:
     return {
-        "fastjsonschema_license": api.read_text(FJS, "LICENSE"),
-        "validate_pyproject_license": _find_and_load_licence(_M.files(dist_name)),
+        "fastjsonschema_license": _read_resource(FJS.__name__, "LICENSE"),
+        "validate_pyproject_license": _load_license_for_package(dist_name),
     }
 
 
+@lru_cache(maxsize=None)
+def _read_resource(package: str, resource: str) -> str:
+    """Templates, copied modules and licenses are static, so they are read only once
+    (e.g. when ``pre_compile`` is called multiple times in the same process).
+    """
+    return api.read_text(package, resource)
+
+
+@lru_cache(maxsize=None)
+def _load_license_for_package(package_name: str) -> str:
+    return _find_and_load_licence(_M.files(package_name))
+
+
 NOCHECK_HEADERS = (
     "# noqa",
     "# type: ignore",
@@ -127,6 +226,7 @@ NOCHECK_HEADERS = (
     "# pylama:skip=1",
     "\n\n# *** PLEASE DO NOT MODIFY DIRECTLY: Automatically generated code *** \n\n\n",
 )
+NOCHECK_HEADER = "\n".join(NOCHECK_HEADERS)
 
 
 def _find_and_load_licence(files: Optional[Sequence[_M.PackagePath]]) -> str:
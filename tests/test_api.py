@@ -1,3 +1,4 @@
+import weakref
 from collections.abc import Mapping
 from functools import partial, wraps
 
@@ -20,6 +21,9 @@ def test_load():
     spec = api.load("project_metadata")
     assert spec["$id"] == f"{PYPA_SPECS}/declaring-project-metadata/"
 
+    # Each call produces an independent copy that can be modified
+    assert api.load("project_metadata") is not spec
+
 
 def test_load_plugin():
     spec = api.load_builtin_plugin("distutils")
@@ -57,10 +61,24 @@ class TestRegistry:
             api.SchemaRegistry([plg])
 
     def test_duplicated_id(self):
-        plg = [plugins.PluginWrapper("plg", self.fake_plugin) for _ in range(2)]
+        def _fake_plugin(name):
+            plg = dict(self.fake_plugin("plg"))
+            plg["description"] = name
+            return types.Schema(plg)
+
+        plg = [plugins.PluginWrapper(name, _fake_plugin) for name in ("a", "b")]
         with pytest.raises(errors.SchemaWithDuplicatedId):
             api.SchemaRegistry(plg)
 
+    def test_duplicated_id_identical_schema(self):
+        def _fake_plugin(_name):
+            return self.fake_plugin("plg")
+
+        plg = [plugins.PluginWrapper(name, _fake_plugin) for name in ("a", "b")]
+        registry = api.SchemaRegistry(plg)
+        tool = registry[registry.main]["properties"]["tool"]["properties"]
+        assert tool["a"] == tool["b"]
+
     def test_missing_id(self):
         def _fake_plugin(name):
             plg = dict(self.fake_plugin(name))
@@ -97,6 +115,14 @@ class TestValidator:
         validator = api.Validator()
         assert validator(self.valid_example) is not None
 
+    def test_weakref(self):
+        validator = api.Validator([self.plugin("distutils")])
+        assert weakref.ref(validator)() is validator
+        registry = validator.registry
+        assert weakref.ref(registry)() is registry
+        handlers = validator.handlers
+        assert weakref.ref(handlers)() is handlers
+
     def test_invalid(self):
         validator = api.Validator()
         with pytest.raises(FJS.JsonSchemaValueException):
@@ -134,3 +160,104 @@ class TestValidator:
 
             assert "setuptools" not in json.dumps(main_schema)
             raise
+
+    def test_compiled_cache(self, monkeypatch):
+        plg = [self.plugin("setuptools")]
+        api.Validator(plg)(self.valid_example)
+
+        def _fail(*_args, **_kwargs):
+            raise AssertionError("schema should not be compiled again")
+
+        monkeypatch.setattr(FJS, "compile", _fail)
+        validator = api.Validator(plg)
+        assert validator(self.valid_example) is not None
+        with pytest.raises(FJS.JsonSchemaValueException):
+            validator(self.invalid_example)
+
+    def test_lazy_registry(self, monkeypatch):
+        plg = [self.plugin("distutils")]
+        api.Validator(plg)(self.valid_example)
+
+        def _fail(*_args, **_kwargs):
+            raise AssertionError("schemas should not be loaded again")
+
+        monkeypatch.setattr(api, "SchemaRegistry", _fail)
+        assert api.Validator(plg)(self.valid_example) is not None
+
+    def test_plugin_errors_on_creation(self):
+        def _fake_plugin(name):
+            return {"$id": f"https://example.com/{name}", "$schema": "invalid"}
+
+        plg = plugins.PluginWrapper("plugin", _fake_plugin)
+        with pytest.raises(errors.InvalidSchemaVersion):
+            api.Validator([plg])
+
+    def test_custom_handlers(self):
+        validator = api.Validator([self.plugin("distutils")])
+        handlers = api.RefHandler(validator.registry)
+        validator.handlers = handlers
+        assert validator.handlers is handlers
+        assert validator(self.valid_example) is not None
+
+    def test_formats_snapshot(self):
+        fmts = dict(api.FORMAT_FUNCTIONS)
+        validator = api.Validator([self.plugin("distutils")], format_validators=fmts)
+        fmts["my-format"] = lambda _: True
+        assert "my-format" not in validator.formats
+        assert validator.formats == api.FORMAT_FUNCTIONS
+
+    def test_compiled_cache_plugins_with_same_id(self):
+        def _make_plugin(pattern):
+            def _plugin(tool):
+                return {
+                    "$id": f"https://example.com/{tool}.schema.json",
+                    "type": "object",
+                    "properties": {"x": {"type": "string", "pattern": pattern}},
+                }
+
+            return _plugin
+
+        example = {"tool": {"plg": {"x": "a"}}}
+        plg_a = plugins.PluginWrapper("plg", _make_plugin("^a$"))
+        plg_b = plugins.PluginWrapper("plg", _make_plugin("^b$"))
+        assert plg_a.id == plg_b.id
+        assert api.Validator([plg_a])(example) is not None
+        with pytest.raises(FJS.JsonSchemaValueException):
+            api.Validator([plg_b])(example)
+
+    def test_compiled_cache_regex_formats(self):
+        example = {"tool": {"plg": {"x": "a"}}}
+
+        def _plugin(tool):
+            return {
+                "$id": f"https://example.com/{tool}-format.schema.json",
+                "type": "object",
+                "properties": {"x": {"type": "string", "format": "my-format"}},
+            }
+
+        plg = [plugins.PluginWrapper("plg", _plugin)]
+        fmts = {**api.FORMAT_FUNCTIONS, "my-format": "^a$"}
+        assert api.Validator(plg, fmts)(example) is not None
+        fmts["my-format"] = "^b$"
+        with pytest.raises(FJS.JsonSchemaValueException):
+            api.Validator(plg, fmts)(example)
+
+    def test_compiled_cache_unhashable_format(self):
+        class _Format:
+            def __eq__(self, other):
+                return self is other
+
+            def __call__(self, value):
+                return True
+
+        fmts = {**api.FORMAT_FUNCTIONS, "x": _Format()}
+        assert api.Validator([self.plugin("distutils")], fmts)(self.valid_example)
+
+    def test_compiled_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(api, "_COMPILED_CACHE", api.OrderedDict())
+        monkeypatch.setattr(api, "_COMPILED_CACHE_SIZE", 2)
+        for i in range(3):
+            schema = {"$id": f"https://example.com/{i}.schema.json", "type": "object"}
+            plg = plugins.PluginWrapper("plg", lambda _, schema=schema: schema)
+            api.Validator([plg])(self.valid_example)
+        assert len(api._COMPILED_CACHE) == 2
@@ -76,3 +76,15 @@ class TestPluginWrapper:
 
         pw = plugins.PluginWrapper("name", _fn2)
         assert pw.help_text == "Help for `name`"
+
+    def test_identity(self):
+        def _make():
+            return lambda _: {}
+
+        fn1, fn2 = _make(), _make()
+        pw1 = plugins.PluginWrapper("name", fn1)
+        pw2 = plugins.PluginWrapper("name", fn2)
+        assert pw1.id == pw2.id
+        assert pw1.identity != pw2.identity
+        assert pw1.identity == plugins.PluginWrapper("name", fn1).identity
+        assert pw1.identity != plugins.PluginWrapper("other", fn1).identity
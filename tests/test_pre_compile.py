@@ -9,7 +9,12 @@ from pathlib import Path
 import pytest
 from validate_pyproject._vendor.fastjsonschema import JsonSchemaValueException
 
-from validate_pyproject.pre_compile import cli, pre_compile
+from validate_pyproject.pre_compile import (
+    TEXT_REPLACEMENTS,
+    cli,
+    pre_compile,
+    replace_text,
+)
 
 from .helpers import EXAMPLES, INVALID, error_file, examples, invalid_examples, toml_
 
@@ -26,6 +31,7 @@ def _pre_compile_checks(path: Path):
         ("error_reporting.py", "def detailed_errors("),
         ("fastjsonschema_exceptions.py", "class JsonSchemaValueException"),
         ("fastjsonschema_validations.py", "def validate("),
+        ("fastjsonschema_validations.py", "from .formats import ("),
         ("extra_validations.py", "def validate"),
         ("formats.py", "def pep508("),
         ("NOTICE", "The relevant copyright notes and licenses are included below"),
@@ -42,6 +48,11 @@ def _pre_compile_checks(path: Path):
         assert "from validate_pyproject._vendor.fastjsonschema" not in file_contents
         assert "from .fastjsonschema_exceptions" in file_contents
 
+    # Make sure the custom formats are referenced directly
+    file_contents = (path / "fastjsonschema_validations.py").read_text()
+    assert 'custom_formats["pep508"]' not in file_contents
+    assert "_fmt_pep508(" in file_contents
+
     # Make sure the pre-compiled lib works
     script = f"""
     from {path.stem} import {Path(MAIN_FILE).stem} as mod
@@ -89,6 +100,28 @@ def test_vendoring_cli(tmp_path):
     assert "from fastjsonschema" not in file_contents
 
 
+def test_replace_text():
+    replacements = {
+        "from a import": "from b import",
+        "from a.c import": "from d import",
+    }
+    text = "from a import x\nfrom a.c import y\nfrom b import z\n"
+    expected = "from b import x\nfrom d import y\nfrom b import z\n"
+    assert replace_text(text, replacements) == expected
+    assert replace_text(text, {}) == text
+
+
+def test_replace_text_after_defaults():
+    # User replacements can act on the output of the default ones
+    replacements = {
+        **TEXT_REPLACEMENTS,
+        "from .fastjsonschema_exceptions import": "from .exc import",
+    }
+    text = "from fastjsonschema import X\nfrom .fastjsonschema_exceptions import Y\n"
+    expected = "from .exc import X\nfrom .exc import Y\n"
+    assert replace_text(text, replacements) == expected
+
+
 # ---- Examples ----
 
 